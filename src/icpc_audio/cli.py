@@ -9,10 +9,7 @@ from rich.console import Console
 from rich.table import Table
 
 from icpc_audio.config import load_config
-from icpc_audio.configure import run_configure
-from icpc_audio.generator import generate_audio
 from icpc_audio.models import AudioFormat, GenerationConfig, Mode
-from icpc_audio.tts import TTSClient
 
 console = Console()
 
@@ -41,7 +38,11 @@ def generate(
     Run 'icpc-audio configure FOLDER' first to create the config file.
     """
     # Load config from the folder
-    saved_config = load_config(folder)
+    try:
+        saved_config = load_config(folder)
+    except ValueError as e:
+        console.print(f"[red]Error: Invalid config: {e}[/red]")
+        raise SystemExit(1)
 
     if not saved_config:
         console.print(f"[red]Error: No icpc-audio.yaml found in {folder}[/red]")
@@ -52,8 +53,8 @@ def generate(
     credentials_path: Optional[Path] = None
     if saved_config.credentials_path:
         credentials_path = Path(saved_config.credentials_path)
-    elif os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
-        credentials_path = Path(os.environ["GOOGLE_APPLICATION_CREDENTIALS"])
+    elif env_credentials := os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        credentials_path = Path(env_credentials)
 
     if not credentials_path:
         console.print("[red]Error: No credentials configured[/red]")
@@ -76,6 +77,9 @@ def generate(
         dry_run=dry_run,
     )
 
+    # Imported here so --help and other subcommands don't load google.cloud
+    from icpc_audio.generator import generate_audio
+
     generate_audio(config)
 
 
@@ -87,6 +91,8 @@ def configure(folder: Path) -> None:
     FOLDER is the path to the contest package folder where icpc-audio.yaml
     will be created.
     """
+    from icpc_audio.configure import run_configure
+
     try:
         run_configure(folder)
     except KeyboardInterrupt:
@@ -115,9 +121,15 @@ def voices(
 
     Optionally specify FOLDER to load credentials from icpc-audio.yaml.
     """
+    from icpc_audio.tts import TTSClient, get_voice_type
+
     # Try to get credentials from config if not provided
     if not credentials and folder:
-        saved_config = load_config(folder)
+        try:
+            saved_config = load_config(folder)
+        except ValueError as e:
+            console.print(f"[red]Error: Invalid config: {e}[/red]")
+            raise SystemExit(1)
         if saved_config and saved_config.credentials_path:
             credentials = Path(saved_config.credentials_path)
 
@@ -134,16 +146,14 @@ def voices(
     table.add_column("Gender")
     table.add_column("Type")
 
-    for v in sorted(voice_list, key=lambda x: (x.language_codes[0], x.name)):
-        lang = v.language_codes[0]
+    # Decorate once so sorting compares plain tuples instead of re-reading protos
+    decorated = [(v.language_codes[0], v.name, i) for i, v in enumerate(voice_list)]
+    decorated.sort()
+
+    for lang, name, i in decorated:
+        v = voice_list[i]
         gender = v.ssml_gender.name
-        if "Neural2" in v.name or "Journey" in v.name:
-            vtype = "Neural"
-        elif "Wavenet" in v.name:
-            vtype = "Wavenet"
-        else:
-            vtype = "Standard"
-        table.add_row(lang, v.name, gender, vtype)
+        table.add_row(lang, name, gender, get_voice_type(name))
 
     console.print(table)
     console.print(f"\nTotal: {len(voice_list)} voices")
@@ -1,5 +1,6 @@
 """Configuration file handling for ICPC Audio Generator."""
 
+from dataclasses import asdict, fields
 from pathlib import Path
 from typing import Optional
 
@@ -7,8 +8,18 @@ import yaml
 
 from icpc_audio.models import Config
 
+# Prefer the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 CONFIG_FILE_NAME = "icpc-audio.yaml"
 
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
+
 
 def get_config_path(folder: Path) -> Path:
     """Get path to config file in specified folder."""
@@ -16,21 +27,39 @@ def get_config_path(folder: Path) -> Path:
 
 
 def load_config(folder: Path) -> Optional[Config]:
-    """Load configuration from file, or return None if not found."""
+    """Load configuration from file, or return None if not found.
+
+    Raises ValueError if the file does not contain a valid configuration.
+    """
     config_path = get_config_path(folder)
-    if not config_path.exists():
+    try:
+        f = open(config_path, "rb")
+    except FileNotFoundError:
         return None
 
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
-        if data is None:
-            return None
-        return Config(**data)
+    with f:
+        data = yaml.load(f, Loader=_SafeLoader)
+
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError(f"{config_path}: expected a mapping of settings")
+    # Ignore unknown keys so config files from other versions still load
+    try:
+        return Config(**{k: v for k, v in data.items() if k in _CONFIG_FIELDS})
+    except ValueError as e:
+        raise ValueError(f"{config_path}: {e}") from None
 
 
 def save_config(config: Config, folder: Path) -> Path:
     """Save configuration to file. Returns the path where it was saved."""
     config_path = get_config_path(folder)
     with open(config_path, "w") as f:
-        yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            asdict(config),
+            f,
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
     return config_path
@@ -8,7 +8,7 @@ from rich.console import Console
 
 from icpc_audio.config import load_config, save_config
 from icpc_audio.models import AudioFormat, Config, Mode
-from icpc_audio.tts import TTSClient
+from icpc_audio.tts import TTSClient, get_voice_type
 
 console = Console()
 
@@ -19,7 +19,11 @@ def run_configure(folder: Path) -> None:
     console.print(f"Configuring for: [cyan]{folder}[/cyan]\n")
 
     # Load existing config for defaults
-    existing = load_config(folder)
+    try:
+        existing = load_config(folder)
+    except ValueError as e:
+        console.print(f"[yellow]Ignoring invalid existing config: {e}[/yellow]\n")
+        existing = None
     if existing:
         console.print("[dim]Found existing config, using as defaults[/dim]\n")
 
@@ -37,8 +41,8 @@ def run_configure(folder: Path) -> None:
     effective_credentials: Path | None = None
     if credentials_path:
         effective_credentials = Path(credentials_path)
-    elif os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
-        effective_credentials = Path(os.environ["GOOGLE_APPLICATION_CREDENTIALS"])
+    elif env_credentials := os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        effective_credentials = Path(env_credentials)
         console.print(f"[dim]Using GOOGLE_APPLICATION_CREDENTIALS: {effective_credentials}[/dim]")
 
     if not effective_credentials:
@@ -109,12 +113,7 @@ def run_configure(folder: Path) -> None:
 
     for v in sorted(voices, key=lambda x: x.name):
         gender = v.ssml_gender.name.lower()
-        if "Neural2" in v.name or "Journey" in v.name:
-            voice_type = "neural"
-        elif "Wavenet" in v.name:
-            voice_type = "wavenet"
-        else:
-            voice_type = "standard"
+        voice_type = get_voice_type(v.name).lower()
         label = f"{v.name} ({gender}, {voice_type})"
         voice_choices.append(questionary.Choice(label, v.name))
 
@@ -1,16 +1,21 @@
 """Main audio generation logic."""
 
+import asyncio
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import time
 from dataclasses import dataclass
+from hashlib import blake2b
 from pathlib import Path
 from typing import Union
 
+from google.cloud import texttospeech
 from rich.console import Console
 from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
 )
@@ -19,13 +24,24 @@ from rich.table import Table
 from icpc_audio.models import GenerationConfig, Mode, Organization, Team
 from icpc_audio.tts import TTSClient
 
+# orjson is optional; the stdlib parser accepts bytes as well
+try:
+    from orjson import loads as json_loads  # type: ignore[import-not-found]
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 console = Console()
 
+DRY_RUN_PREVIEW_LIMIT = 20
+PROGRESS_BATCH_SIZE = 32
+PROGRESS_FLUSH_INTERVAL = 0.1  # seconds
+
+MANIFEST_FILE_NAME = ".icpc-audio-manifest.json"
+
 
 def load_organizations(json_path: Path) -> list[Organization]:
     """Load organizations from JSON file."""
-    with open(json_path) as f:
-        data = json.load(f)
+    data = json_loads(json_path.read_bytes())
     return [
         Organization(
             id=item["id"],
@@ -39,8 +55,7 @@ def load_organizations(json_path: Path) -> list[Organization]:
 
 def load_teams(json_path: Path) -> list[Team]:
     """Load teams from JSON file."""
-    with open(json_path) as f:
-        data = json.load(f)
+    data = json_loads(json_path.read_bytes())
     return [
         Team(
             id=item["id"],
@@ -58,12 +73,64 @@ def get_output_path(config: GenerationConfig, item_id: str) -> Path:
     return config.folder_path / subdir / item_id / f"audio.{config.audio_format.value}"
 
 
+def find_existing_ids(config: GenerationConfig) -> set[str]:
+    """Get IDs of items that already have an audio file in the output folder."""
+    base = config.folder_path / config.mode.value
+    audio_name = f"audio.{config.audio_format.value}"
+    try:
+        with os.scandir(base) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.isfile(os.path.join(entry.path, audio_name))
+            }
+    except FileNotFoundError:
+        return set()
+
+
+def get_signature(config: GenerationConfig, text: str) -> str:
+    """Get a signature of the text and voice settings behind a generated file.
+
+    The audio format is not included: it is part of the manifest key, since
+    each format is written to its own file.
+    """
+    key = f"{text}|{config.voice}|{config.language}"
+    return blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def get_manifest_key(config: GenerationConfig) -> str:
+    """Get the manifest section for the configured mode and format, e.g. "teams/mp3"."""
+    return f"{config.mode.value}/{config.audio_format.value}"
+
+
+def load_manifest(folder: Path) -> dict[str, dict[str, str]]:
+    """Load the manifest of generated audio signatures, per output and item ID."""
+    try:
+        data = json_loads((folder / MANIFEST_FILE_NAME).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Drop malformed sections rather than failing on them later
+    return {key: section for key, section in data.items() if isinstance(section, dict)}
+
+
+def save_manifest(folder: Path, manifest: dict[str, dict[str, str]]) -> None:
+    """Atomically write the manifest of generated audio signatures."""
+    manifest_path = folder / MANIFEST_FILE_NAME
+    tmp_path = manifest_path.with_name(f"{MANIFEST_FILE_NAME}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp_path, manifest_path)
+
+
 @dataclass
 class GenerationTask:
     """A single audio generation task."""
 
     item: Union[Organization, Team]
     output_path: Path
+    text: str
 
 
 @dataclass
@@ -75,31 +142,78 @@ class GenerationResult:
     error: str | None = None
 
 
-def generate_single(
+async def generate_single(
     task: GenerationTask,
     tts_client: TTSClient,
-    config: GenerationConfig,
+    voice: texttospeech.VoiceSelectionParams,
+    audio_config: texttospeech.AudioConfig,
+    semaphore: asyncio.Semaphore,
 ) -> GenerationResult:
     """Generate audio for a single item."""
-    try:
-        # Ensure parent directory exists
-        task.output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Generate audio
-        audio_bytes = tts_client.synthesize(
-            text=task.item.display_text,
-            language_code=config.language,
-            voice_name=config.voice,
-            audio_format=config.audio_format.value,
-        )
+    async with semaphore:
+        try:
+            # Generate audio
+            audio_bytes = await tts_client.synthesize(
+                text=task.text,
+                voice=voice,
+                audio_config=audio_config,
+            )
+
+            # Write to file
+            task.output_path.write_bytes(audio_bytes)
 
-        # Write to file
-        with open(task.output_path, "wb") as f:
-            f.write(audio_bytes)
+            return GenerationResult(task=task, success=True)
+        except Exception as e:
+            return GenerationResult(task=task, success=False, error=str(e))
 
-        return GenerationResult(task=task, success=True)
-    except Exception as e:
-        return GenerationResult(task=task, success=False, error=str(e))
+
+async def run_all(
+    to_generate: list[GenerationTask],
+    tts_client: TTSClient,
+    config: GenerationConfig,
+    progress: Progress,
+    task_id: TaskID,
+) -> list[GenerationResult]:
+    """Generate all tasks concurrently, at most config.jobs requests in flight."""
+    semaphore = asyncio.Semaphore(config.jobs)
+    results: list[GenerationResult] = []
+    done_count = 0
+    last_flush = time.monotonic()
+
+    # Voice and audio config are identical for every request, so build them once
+    voice, audio_config = tts_client.prepare_session(
+        language_code=config.language,
+        voice_name=config.voice,
+        audio_format=config.audio_format.value,
+    )
+
+    for next_result in asyncio.as_completed(
+        [
+            generate_single(task, tts_client, voice, audio_config, semaphore)
+            for task in to_generate
+        ]
+    ):
+        result = await next_result
+        results.append(result)
+
+        # Batch progress updates by count, but flush at least every
+        # PROGRESS_FLUSH_INTERVAL so slow runs still show steady progress
+        done_count += 1
+        now = time.monotonic()
+        if (
+            done_count >= PROGRESS_BATCH_SIZE
+            or now - last_flush >= PROGRESS_FLUSH_INTERVAL
+            or len(results) == len(to_generate)
+        ):
+            last_flush = now
+            progress.update(
+                task_id,
+                description=f"Generated: {result.task.text[:40]}...",
+                advance=done_count,
+            )
+            done_count = 0
+
+    return results
 
 
 def generate_audio(config: GenerationConfig) -> None:
@@ -107,51 +221,75 @@ def generate_audio(config: GenerationConfig) -> None:
     # Load data
     json_file = config.folder_path / f"{config.mode.value}.json"
 
-    if not json_file.exists():
+    try:
+        if config.mode == Mode.ORGANIZATIONS:
+            items: list[Union[Organization, Team]] = load_organizations(json_file)
+        else:
+            items = load_teams(json_file)
+    except FileNotFoundError:
         console.print(f"[red]Error: {json_file} not found![/red]")
         raise SystemExit(1)
 
-    if config.mode == Mode.ORGANIZATIONS:
-        items: list[Union[Organization, Team]] = load_organizations(json_file)
-    else:
-        items = load_teams(json_file)
-
     console.print(f"\n[bold]Loaded {len(items)} {config.mode.value}[/bold]")
     console.print(f"  Voice: [cyan]{config.voice}[/cyan]")
     console.print(f"  Format: [cyan]{config.audio_format.value}[/cyan]")
     console.print(f"  Parallel jobs: [cyan]{config.jobs}[/cyan]")
 
-    # Determine what needs to be generated
-    to_generate: list[GenerationTask] = []
-    skipped: list[tuple[Union[Organization, Team], Path, str]] = []
-
-    for item in items:
-        output_path = get_output_path(config, item.id)
-
-        if not config.force and output_path.exists():
-            skipped.append((item, output_path, "exists"))
+    # Determine what needs to be generated, working on plain parallel lists
+    # of IDs and texts; pending/skipped hold indices into them
+    ids = [item.id for item in items]
+    texts = [item.display_text for item in items]
+    pending: list[int] = []
+    skipped: list[int] = []
+
+    existing_ids = set() if config.force else find_existing_ids(config)
+    manifest = load_manifest(config.folder_path)
+    signatures = manifest.setdefault(get_manifest_key(config), {})
+
+    for i, item_id in enumerate(ids):
+        if item_id not in existing_ids:
+            pending.append(i)
+        elif item_id in signatures and signatures[item_id] != get_signature(
+            config, texts[i]
+        ):
+            # Text or voice settings changed since the audio was generated
+            pending.append(i)
         else:
-            to_generate.append(GenerationTask(item=item, output_path=output_path))
+            skipped.append(i)
 
     # Show summary
-    console.print(f"\n  To generate: [green]{len(to_generate)}[/green]")
+    console.print(f"\n  To generate: [green]{len(pending)}[/green]")
     console.print(f"  Skipped (existing): [yellow]{len(skipped)}[/yellow]")
 
     if config.dry_run:
-        show_dry_run_preview(to_generate, skipped, config)
+        show_dry_run_preview(ids, texts, pending, skipped, config)
         return
 
-    if not to_generate:
+    if not pending:
         console.print("\n[green]Nothing to generate![/green]")
         return
 
+    to_generate = [
+        GenerationTask(
+            item=items[i],
+            output_path=get_output_path(config, ids[i]),
+            text=texts[i],
+        )
+        for i in pending
+    ]
+
+    # Create output directories up front so workers only write files
+    try:
+        for parent in {task.output_path.parent for task in to_generate}:
+            parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        console.print(f"[red]Error: could not create output directory: {e}[/red]")
+        raise SystemExit(1)
+
     # Initialize TTS client
     tts_client = TTSClient(config.credentials_path)
 
-    # Generate with progress bar and parallel execution
-    errors: list[GenerationResult] = []
-    successful = 0
-
+    # Generate with progress bar and concurrent requests
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -161,24 +299,24 @@ def generate_audio(config: GenerationConfig) -> None:
     ) as progress:
         task_id = progress.add_task("Generating audio...", total=len(to_generate))
 
-        with ThreadPoolExecutor(max_workers=config.jobs) as executor:
-            futures = {
-                executor.submit(generate_single, task, tts_client, config): task
-                for task in to_generate
-            }
+        results = asyncio.run(
+            run_all(to_generate, tts_client, config, progress, task_id)
+        )
 
-            for future in as_completed(futures):
-                result = future.result()
-                if result.success:
-                    successful += 1
-                else:
-                    errors.append(result)
+    errors: list[GenerationResult] = []
+    successful = 0
+    for result in results:
+        if result.success:
+            successful += 1
+            signatures[result.task.item.id] = get_signature(config, result.task.text)
+        else:
+            errors.append(result)
 
-                progress.update(
-                    task_id,
-                    description=f"Generated: {result.task.item.display_text[:40]}...",
-                    advance=1,
-                )
+    if successful:
+        try:
+            save_manifest(config.folder_path, manifest)
+        except OSError as e:
+            console.print(f"[yellow]Warning: could not save manifest: {e}[/yellow]")
 
     # Summary
     console.print(f"\n[bold]Generation complete![/bold]")
@@ -187,34 +325,42 @@ def generate_audio(config: GenerationConfig) -> None:
         console.print(f"  Errors: [red]{len(errors)}[/red]")
         for result in errors:
             console.print(
-                f"    - {result.task.item.id} ({result.task.item.display_text}): {result.error}"
+                f"    - {result.task.item.id} ({result.task.text}): {result.error}"
             )
 
 
 def show_dry_run_preview(
-    to_generate: list[GenerationTask],
-    skipped: list[tuple[Union[Organization, Team], Path, str]],
+    ids: list[str],
+    texts: list[str],
+    pending: list[int],
+    skipped: list[int],
     config: GenerationConfig,
 ) -> None:
-    """Show preview of what would be generated."""
+    """Show preview of what would be generated.
+
+    pending and skipped are indices into the parallel ids and texts lists.
+    """
     console.print("\n[bold yellow]DRY RUN - No files will be created[/bold yellow]\n")
 
-    if to_generate:
+    if pending:
         table = Table(title="Files to Generate")
         table.add_column("ID", style="cyan")
         table.add_column("Text to Speak", style="green")
         table.add_column("Output Path", style="dim")
 
-        for task in to_generate[:20]:  # Limit preview
-            rel_path = task.output_path.relative_to(config.folder_path)
+        # Only resolve output paths for the rows that are actually shown
+        for i in pending[:DRY_RUN_PREVIEW_LIMIT]:
+            rel_path = get_output_path(config, ids[i]).relative_to(config.folder_path)
             table.add_row(
-                task.item.id,
-                task.item.display_text[:50],
+                ids[i],
+                texts[i][:50],
                 str(rel_path),
             )
 
-        if len(to_generate) > 20:
-            table.add_row("...", f"({len(to_generate) - 20} more)", "...")
+        if len(pending) > DRY_RUN_PREVIEW_LIMIT:
+            table.add_row(
+                "...", f"({len(pending) - DRY_RUN_PREVIEW_LIMIT} more)", "..."
+            )
 
         console.print(table)
 
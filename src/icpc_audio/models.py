@@ -5,8 +5,6 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel
-
 
 class Mode(str, Enum):
     """Generation mode."""
@@ -24,7 +22,7 @@ class AudioFormat(str, Enum):
     OGG = "ogg"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Organization:
     """Organization data from organizations.json."""
 
@@ -39,7 +37,7 @@ class Organization:
         return self.formal_name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Team:
     """Team data from teams.json."""
 
@@ -54,7 +52,8 @@ class Team:
         return self.display_name or self.name
 
 
-class Config(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Config:
     """Configuration stored in icpc-audio.yaml."""
 
     credentials_path: Optional[str] = None
@@ -64,8 +63,36 @@ class Config(BaseModel):
     mode: str = "teams"
     jobs: int = 4
 
-
-@dataclass
+    def __post_init__(self) -> None:
+        """Validate and coerce values read from YAML; raises ValueError."""
+        if not isinstance(self.mode, str) or self.mode not in {m.value for m in Mode}:
+            raise ValueError(f"invalid mode {self.mode!r}")
+        if not isinstance(self.format, str) or self.format not in {
+            f.value for f in AudioFormat
+        }:
+            raise ValueError(f"invalid format {self.format!r}")
+        for name in ("language", "voice"):
+            if not isinstance(getattr(self, name), str):
+                raise ValueError(f"{name} must be a string")
+        try:
+            jobs = int(self.jobs)
+        except (TypeError, ValueError):
+            jobs = None
+        if (
+            jobs is None
+            or isinstance(self.jobs, bool)
+            or (isinstance(self.jobs, float) and jobs != self.jobs)
+        ):
+            raise ValueError(f"jobs must be an integer, got {self.jobs!r}")
+        if jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {jobs}")
+        # Frozen dataclass: assign the coerced values through object.__setattr__
+        object.__setattr__(self, "jobs", jobs)
+        if self.credentials_path is not None:
+            object.__setattr__(self, "credentials_path", str(self.credentials_path))
+
+
+@dataclass(slots=True)
 class GenerationConfig:
     """Runtime configuration for audio generation."""
 
@@ -1,11 +1,35 @@
 """Google Text-to-Speech API wrapper."""
 
+import hashlib
+import json
 import os
+import time
 from pathlib import Path
 from typing import Optional
 
 from google.cloud import texttospeech
 
+VOICE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Voice model (third part of e.g. "en-US-Neural2-A") to voice type
+_VOICE_TYPES = {
+    "Neural2": "Neural",
+    "Journey": "Neural",
+    "Wavenet": "Wavenet",
+}
+
+
+def get_voice_type(voice_name: str) -> str:
+    """Classify a voice name as Neural, Wavenet or Standard."""
+    parts = voice_name.split("-", 3)
+    return _VOICE_TYPES.get(parts[2], "Standard") if len(parts) > 2 else "Standard"
+
+
+def get_cache_dir() -> Path:
+    """Get the per-user cache directory for this tool."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "icpc-audio"
+
 
 class TTSClient:
     """Wrapper for Google Text-to-Speech API."""
@@ -21,34 +45,78 @@ class TTSClient:
         """Initialize TTS client with optional credentials path."""
         if credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(credentials_path)
-        self._client = texttospeech.TextToSpeechClient()
+        self._credentials = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
+        # Both clients are created lazily: generation only needs the async one,
+        # whose channel binds to the running event loop, and listing voices
+        # from the on-disk cache needs neither
+        self._client: Optional[texttospeech.TextToSpeechClient] = None
+        self._async_client: Optional[texttospeech.TextToSpeechAsyncClient] = None
+        # Per-instance memo of voice listings, keyed by language filter
+        self._voices: dict[Optional[str], list[texttospeech.Voice]] = {}
+        self._languages: Optional[list[str]] = None
+
+    def _voice_cache_path(self, language_code: Optional[str]) -> Path:
+        """Get the cache file for a voice listing."""
+        # Hash user-provided values so they can never escape the cache directory
+        key = f"{self._credentials}\0{language_code or ''}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return get_cache_dir() / f"voices-{digest}.json"
 
     def list_voices(
         self, language_code: Optional[str] = None
     ) -> list[texttospeech.Voice]:
-        """List available voices, optionally filtered by language."""
+        """List available voices, optionally filtered by language.
+
+        Results are cached on disk for VOICE_CACHE_TTL seconds per credentials
+        file and language, and in memory for the lifetime of the client.
+        """
+        if language_code not in self._voices:
+            self._voices[language_code] = self._fetch_voices(language_code)
+        return self._voices[language_code]
+
+    def _fetch_voices(self, language_code: Optional[str]) -> list[texttospeech.Voice]:
+        """Get voices from the on-disk cache, or from the API if stale."""
+        cache_path = self._voice_cache_path(language_code)
+        try:
+            if time.time() - cache_path.stat().st_mtime < VOICE_CACHE_TTL:
+                data = json.loads(cache_path.read_bytes())
+                return [texttospeech.Voice(item) for item in data]
+        except (OSError, ValueError):
+            pass
+
+        if self._client is None:
+            self._client = texttospeech.TextToSpeechClient()
         response = self._client.list_voices(language_code=language_code)
-        return list(response.voices)
+        voices = list(response.voices)
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps([texttospeech.Voice.to_dict(v) for v in voices])
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Caching is best-effort
+
+        return voices
 
     def list_languages(self) -> list[str]:
         """Get list of unique language codes."""
-        voices = self.list_voices()
-        languages: set[str] = set()
-        for voice in voices:
-            for lang in voice.language_codes:
-                languages.add(lang)
-        return sorted(languages)
-
-    def synthesize(
+        if self._languages is None:
+            languages: set[str] = set()
+            for voice in self.list_voices():
+                languages.update(voice.language_codes)
+            self._languages = sorted(languages)
+        return self._languages
+
+    def prepare_session(
         self,
-        text: str,
         language_code: str,
         voice_name: str,
         audio_format: str,
-    ) -> bytes:
-        """Synthesize speech and return audio bytes."""
-        synthesis_input = texttospeech.SynthesisInput(text=text)
-
+    ) -> tuple[texttospeech.VoiceSelectionParams, texttospeech.AudioConfig]:
+        """Build the voice and audio config shared by every request in a run."""
         voice = texttospeech.VoiceSelectionParams(
             language_code=language_code,
             name=voice_name,
@@ -58,8 +126,20 @@ class TTSClient:
             audio_encoding=self.ENCODING_MAP[audio_format],
         )
 
-        response = self._client.synthesize_speech(
-            input=synthesis_input,
+        return voice, audio_config
+
+    async def synthesize(
+        self,
+        text: str,
+        voice: texttospeech.VoiceSelectionParams,
+        audio_config: texttospeech.AudioConfig,
+    ) -> bytes:
+        """Synthesize speech with configs from prepare_session(); return audio bytes."""
+        if self._async_client is None:
+            self._async_client = texttospeech.TextToSpeechAsyncClient()
+
+        response = await self._async_client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
             voice=voice,
             audio_config=audio_config,
         )